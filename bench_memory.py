@@ -0,0 +1,88 @@
+"""Memory benchmark: materialized task loading vs streaming iteration.
+
+Seeds a scratch collection with synthetic tasks, then measures peak Python
+heap (tracemalloc) and wall time for reading every task via
+list(iter_tasks()) ("materialized", as the old load_tasks() did) and
+via iter_tasks() consumed one task at a time ("streaming").
+
+Example:
+    python bench_memory.py --tasks 1000000
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from pymongo import MongoClient
+
+import app as revision_app
+
+INSERT_BATCH = 10_000
+
+
+def seed(collection, count):
+    """Insert `count` synthetic tasks shaped like the ones add_task() creates"""
+    now = datetime.now()
+    for start in range(0, count, INSERT_BATCH):
+        collection.insert_many([
+            {
+                'task_id': i + 1,
+                'title': f"Concept {i + 1}",
+                'description': "Key points to remember, examples, or notes about this concept.",
+                'status': 'pending',
+                'current_cycle': i % 8,
+                'created_at': (now - timedelta(days=i % 365)).isoformat(),
+                'last_completed': now.isoformat(),
+                'next_review': (now + timedelta(days=i % 20)).isoformat(),
+            }
+            for i in range(start, min(start + INSERT_BATCH, count))
+        ])
+
+
+def measure(label, consume):
+    """Run `consume` under tracemalloc and print its peak heap and duration"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    seen = consume()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {seen:>10} tasks  peak {peak / 2**20:9.1f} MiB  {elapsed:7.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory use of materialized and streaming task reads")
+    # Never default to the app's production cluster: the benchmark writes 1M documents
+    parser.add_argument('--uri', default='mongodb://localhost:27017',
+                        help="MongoDB to seed and read from (default: local server)")
+    parser.add_argument('--db', default='revision_app_bench')
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--batch-size', type=int, default=revision_app.TASK_BATCH_SIZE)
+    parser.add_argument('--keep', action='store_true', help="keep the seeded collection afterwards")
+    args = parser.parse_args()
+
+    client = MongoClient(args.uri)
+    collection = client[args.db]['tasks']
+    if collection.estimated_document_count() != args.tasks:
+        collection.drop()
+        print(f"Seeding {args.tasks} tasks...")
+        seed(collection, args.tasks)
+
+    def materialized():
+        tasks = list(revision_app.iter_tasks(collection=collection, batch_size=args.batch_size))
+        return len(tasks)
+
+    def streaming():
+        return sum(1 for _ in revision_app.iter_tasks(collection=collection, batch_size=args.batch_size))
+
+    try:
+        measure('materialized', materialized)
+        measure('streaming', streaming)
+    finally:
+        if not args.keep:
+            collection.drop()
+        client.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+from datetime import datetime, timedelta
+
+# Spaced repetition intervals (in days)
+REVISION_INTERVALS = [1, 3, 7, 14, 20]
+
+def get_next_review_date(current_cycle):
+    """Calculate next review date based on current cycle"""
+    if current_cycle < len(REVISION_INTERVALS):
+        days_to_add = REVISION_INTERVALS[current_cycle]
+    else:
+        # After completing the cycle, repeat every 20 days
+        days_to_add = 20
+    
+    return (datetime.now() + timedelta(days=days_to_add)).isoformat()
@@ -0,0 +1,204 @@
+"""Production launcher: pre-forked waitress workers sharing one listening socket.
+
+Each worker is a separate process with its own GIL and its own MongoDB
+client, created after fork and warmed up before the worker starts accepting
+connections.
+
+Example:
+    python server.py --workers 4 --threads 8
+
+Signals:
+    SIGHUP          restart workers one at a time without dropping the socket
+    SIGTERM/SIGINT  stop all workers and exit
+"""
+import argparse
+import os
+import select
+import signal
+import socket
+import sys
+import time
+
+from waitress.server import create_server
+
+import app as revision_app
+
+# Seconds a restarted worker gets to warm up before the old one is stopped
+READY_TIMEOUT = 60
+# Minimum seconds between respawns of a worker that keeps crashing
+RESPAWN_DELAY = 1
+
+
+def create_listen_socket(host, port, backlog):
+    """Bind the socket that all workers accept connections from"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+
+def _stop_worker(signum, frame):
+    # waitress catches SystemExit and lets in-flight requests finish
+    raise SystemExit(0)
+
+
+def run_worker(index, sock, args, ready_fd):
+    """Body of a forked worker process; never returns"""
+    exit_code = 0
+    try:
+        signal.signal(signal.SIGTERM, _stop_worker)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        # init_db() runs once per process, so a worker without a connection
+        # would never get one; exit and let the arbiter respawn it instead
+        if revision_app.init_db(min_pool_size=args.threads) is None:
+            raise Exception("MongoDB connection not available")
+        revision_app.warm_up()
+        # Only one worker runs the periodic tiering job
+        if index == 0:
+            revision_app.start_tiering_scheduler()
+
+        server = create_server(
+            revision_app.app,
+            sockets=[sock],
+            threads=args.threads,
+            connection_limit=args.connection_limit,
+            backlog=args.backlog,
+        )
+        if ready_fd is not None:
+            os.write(ready_fd, b'1')
+            os.close(ready_fd)
+        print(f"Worker {index} (pid {os.getpid()}) ready")
+        server.run()
+    except Exception as e:
+        print(f"Worker {index} failed: {e}")
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        os._exit(exit_code)
+
+
+def wait_ready(ready_fd, timeout=READY_TIMEOUT):
+    """Wait until a worker reports that it is warmed up"""
+    try:
+        readable, _, _ = select.select([ready_fd], [], [], timeout)
+        return bool(readable) and os.read(ready_fd, 1) == b'1'
+    finally:
+        os.close(ready_fd)
+
+
+class Arbiter:
+    """Forks workers, respawns them when they die and handles signals"""
+
+    def __init__(self, sock, args):
+        self.sock = sock
+        self.args = args
+        self.workers = {}  # pid -> worker index
+        self.stopping = False
+        self.reloading = False
+
+    def spawn(self, index, wait=False):
+        """Fork a worker; with wait=True, return whether it became ready"""
+        ready_r, ready_w = os.pipe() if wait else (None, None)
+        pid = os.fork()
+        if pid == 0:
+            if wait:
+                os.close(ready_r)
+            run_worker(index, self.sock, self.args, ready_w)
+        self.workers[pid] = index
+        if not wait:
+            return True
+        os.close(ready_w)
+        if wait_ready(ready_r):
+            return True
+        print(f"Worker {index} (pid {pid}) did not become ready, stopping it")
+        self.kill(pid)
+        os.waitpid(pid, 0)
+        self.workers.pop(pid, None)
+        return False
+
+    def kill(self, pid):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def reap(self, block=False):
+        """Collect exited workers and return their indexes"""
+        exited = []
+        while self.workers:
+            pid, _ = os.waitpid(-1, 0 if block else os.WNOHANG)
+            if pid == 0:
+                break
+            index = self.workers.pop(pid, None)
+            if index is not None:
+                exited.append(index)
+        return exited
+
+    def rolling_restart(self):
+        """Replace each worker with a warmed-up new one before stopping the old one"""
+        for old_pid, index in list(self.workers.items()):
+            if not self.spawn(index, wait=True):
+                print("Restart aborted, keeping the remaining workers")
+                return
+            self.kill(old_pid)
+            os.waitpid(old_pid, 0)
+            self.workers.pop(old_pid, None)
+
+    def handle_stop(self, signum, frame):
+        self.stopping = True
+
+    def handle_reload(self, signum, frame):
+        self.reloading = True
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.handle_stop)
+        signal.signal(signal.SIGINT, self.handle_stop)
+        signal.signal(signal.SIGHUP, self.handle_reload)
+
+        for index in range(self.args.workers):
+            self.spawn(index)
+
+        while not self.stopping:
+            if self.reloading:
+                self.reloading = False
+                print("Restarting workers")
+                self.rolling_restart()
+            for index in self.reap():
+                if self.stopping:
+                    break
+                print(f"Worker {index} exited, respawning")
+                time.sleep(RESPAWN_DELAY)
+                self.spawn(index)
+            time.sleep(0.5)
+
+        print("Stopping workers")
+        for pid in list(self.workers):
+            self.kill(pid)
+        while self.workers:
+            self.reap(block=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the app with pre-forked waitress workers")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: one per core)")
+    parser.add_argument('--threads', type=int, default=4,
+                        help="request threads per worker")
+    parser.add_argument('--connection-limit', type=int, default=100,
+                        help="open connections per worker")
+    parser.add_argument('--backlog', type=int, default=1024,
+                        help="listen backlog of the shared socket")
+    args = parser.parse_args()
+
+    sock = create_listen_socket(args.host, args.port, args.backlog)
+    print(f"Serving on http://{args.host}:{args.port} with {args.workers} workers")
+    Arbiter(sock, args).run()
+
+
+if __name__ == '__main__':
+    main()